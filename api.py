@@ -1,30 +1,61 @@
 import os
+import time
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import threading
+from typing import Annotated, Dict, List, Optional
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, status
+import orjson
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, validator
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
 # Import the tool functions
 from tool import (
-    generate_probing_questions,
-    summarize_user_profile,
-    get_personalized_news,
-    query_news_feed
+    create_http_client,
+    create_provider_limit,
+    awarm_up_models,
+    agenerate_probing_questions,
+    asummarize_user_profile,
+    aget_personalized_news,
+    aget_personalized_news_stream,
+    aquery_news_feed,
+    aquery_news_feed_stream
 )
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+# LOG_LEVEL=WARNING in production skips formatting the per-request INFO lines
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
+# Common ISO 639-1 language codes; other codes are allowed but logged
+VALID_LANGUAGE_CODES = frozenset(('en', 'es', 'fr', 'de', 'it', 'pt', 'nl', 'ru', 'ja', 'ko', 'zh', 'ar', 'hi'))
+
+def validate_language_code(v: str) -> str:
+    if v not in VALID_LANGUAGE_CODES:
+        logger.warning("Language code '%s' not in common codes list, but allowing it", v)
+    return v
+
+LanguageCode = Annotated[str, AfterValidator(validate_language_code)]
+
+# Responses are built once and never mutated
+RESPONSE_CONFIG = ConfigDict(frozen=True, extra='ignore')
+
 # Pydantic models for request/response validation
+class LanguageMixin(BaseModel):
+    """Base for requests that take a target language"""
+    target_language: LanguageCode = Field(default="en", description="Target language code (ISO 639-1)")
+
 class InterestRequest(BaseModel):
     interest_text: str = Field(..., min_length=1, max_length=500, description="User's initial interest description")
 
 class QuestionResponse(BaseModel):
+    model_config = RESPONSE_CONFIG
     questions: List[str] = Field(..., description="List of probing questions")
 
 class ProfileRequest(BaseModel):
@@ -32,21 +63,14 @@ class ProfileRequest(BaseModel):
     answers: Dict[str, str] = Field(..., description="Dictionary of question-answer pairs")
 
 class ProfileResponse(BaseModel):
+    model_config = RESPONSE_CONFIG
     profile_summary: str = Field(..., description="Generated user profile summary")
 
-class NewsRequest(BaseModel):
+class NewsRequest(LanguageMixin):
     profile_summary: str = Field(..., min_length=1, max_length=1000, description="User profile summary")
-    target_language: str = Field(default="en", description="Target language code (ISO 639-1)")
-    
-    @validator('target_language')
-    def validate_language_code(cls, v):
-        # Basic validation for common language codes
-        valid_codes = ['en', 'es', 'fr', 'de', 'it', 'pt', 'nl', 'ru', 'ja', 'ko', 'zh', 'ar', 'hi']
-        if v not in valid_codes:
-            logger.warning(f"Language code '{v}' not in common codes list, but allowing it")
-        return v
 
 class NewsArticle(BaseModel):
+    model_config = RESPONSE_CONFIG
     title: str
     link: str
     source: str
@@ -54,33 +78,114 @@ class NewsArticle(BaseModel):
     snippet: str
 
 class NewsResponse(BaseModel):
+    model_config = RESPONSE_CONFIG
     articles: List[NewsArticle] = Field(..., description="List of personalized news articles")
     profile_summary: str = Field(..., description="Profile summary used for news generation")
+    cache_key: str = Field(..., description="Key identifying this news feed for /query-news")
 
-class QueryRequest(BaseModel):
+class QueryRequest(LanguageMixin):
     question: str = Field(..., min_length=1, max_length=500, description="Question about the news feed")
-    target_language: str = Field(default="en", description="Target language code (ISO 639-1)")
-    
-    @validator('target_language')
-    def validate_language_code(cls, v):
-        valid_codes = ['en', 'es', 'fr', 'de', 'it', 'pt', 'nl', 'ru', 'ja', 'ko', 'zh', 'ar', 'hi']
-        if v not in valid_codes:
-            logger.warning(f"Language code '{v}' not in common codes list, but allowing it")
-        return v
+    cache_key: Optional[str] = Field(default=None, min_length=1, description="Feed key returned by /generate-news or /full-pipeline; defaults to the most recently generated feed")
 
 class QueryResponse(BaseModel):
+    model_config = RESPONSE_CONFIG
     answer: str = Field(..., description="Answer to the user's question")
 
 class HealthResponse(BaseModel):
+    model_config = RESPONSE_CONFIG
     status: str
     message: str
 
 class ErrorResponse(BaseModel):
+    model_config = RESPONSE_CONFIG
     error: str
     detail: str
 
-# Global variable to store news articles for querying
-news_articles_cache: Dict[str, List[dict]] = {}
+# Generated news feeds, kept for querying. Bounded in size and age so the
+# cache can't grow without limit; TTLCache isn't thread-safe, hence the lock.
+NEWS_CACHE_MAXSIZE = 1024
+NEWS_CACHE_TTL = 1800  # seconds
+news_articles_cache: TTLCache = TTLCache(maxsize=NEWS_CACHE_MAXSIZE, ttl=NEWS_CACHE_TTL)
+news_articles_cache_lock = threading.Lock()
+# Key of the most recently cached feed, used when a query doesn't name one
+latest_cache_key: Optional[str] = None
+CACHE_KEY_HEADER = "X-Cache-Key"
+
+def feed_cache_key(profile_summary: str, target_language: str) -> str:
+    return hashlib.blake2b(f"{profile_summary}|{target_language}".encode(), digest_size=16).hexdigest()
+
+def cache_feed(cache_key: str, articles: List[dict]) -> None:
+    global latest_cache_key
+    with news_articles_cache_lock:
+        news_articles_cache[cache_key] = articles
+        latest_cache_key = cache_key
+
+def get_cached_feed(cache_key: Optional[str] = None) -> Optional[List[dict]]:
+    with news_articles_cache_lock:
+        if cache_key is None:
+            cache_key = latest_cache_key
+        if cache_key is None:
+            return None
+        return news_articles_cache.get(cache_key)
+
+# Identical requests that arrive while one is already being served share its
+# result instead of each paying for the same LLM calls
+inflight_requests: Dict[str, asyncio.Future] = {}
+
+def request_key(endpoint: str, payload: BaseModel) -> str:
+    body = orjson.dumps(payload.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(endpoint.encode() + b"|" + body, digest_size=16).hexdigest()
+
+async def singleflight(key: str, coro_factory):
+    """Run coro_factory() once per key among concurrent callers"""
+    future = inflight_requests.get(key)
+    if future is not None:
+        # Shield so a disconnecting follower doesn't cancel the shared result
+        return await asyncio.shield(future)
+    
+    future = asyncio.get_running_loop().create_future()
+    # Mark the exception as retrieved even when nobody else was waiting
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    inflight_requests[key] = future
+    try:
+        result = await coro_factory()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        inflight_requests.pop(key, None)
+
+# Clients opt into streamed NDJSON responses through the Accept header
+STREAM_MEDIA_TYPE = "application/x-ndjson"
+# Answer chunks are coalesced over this window (seconds) to amortize ASGI send overhead
+STREAM_FLUSH_INTERVAL = 0.05
+# Streams opt out of gzip: the compressor would hold lines back until its
+# buffer fills, defeating the point of streaming
+STREAM_HEADERS = {"Content-Encoding": "identity"}
+
+def wants_stream(http_request: Request) -> bool:
+    return STREAM_MEDIA_TYPE in http_request.headers.get("accept", "")
+
+async def batch_chunks(chunks, interval: float = STREAM_FLUSH_INTERVAL):
+    """Coalesce text chunks produced within `interval` seconds into one"""
+    buffer = []
+    last_flush = time.monotonic()
+    async for chunk in chunks:
+        buffer.append(chunk)
+        if time.monotonic() - last_flush >= interval:
+            yield "".join(buffer)
+            buffer.clear()
+            last_flush = time.monotonic()
+    if buffer:
+        yield "".join(buffer)
+
+REQUIRED_ENV_VARS = ("GOOGLE_API_KEY", "SERPER_API_KEY")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -88,21 +193,38 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting FastAPI application...")
     
-    # Validate environment variables
-    required_env_vars = ["GOOGLE_API_KEY", "SERPER_API_KEY"]
-    missing_vars = [var for var in required_env_vars if not os.getenv(var)]
+    # Validate environment variables once; /health reports the cached result
+    missing_vars = [var for var in REQUIRED_ENV_VARS if not os.getenv(var)]
+    app.state.env_ok = not missing_vars
     
     if missing_vars:
-        logger.error(f"Missing required environment variables: {missing_vars}")
+        logger.error("Missing required environment variables: %s", missing_vars)
         raise RuntimeError(f"Missing required environment variables: {missing_vars}")
     
     logger.info("All required environment variables are set")
+    
+    # One pooled HTTP/2 client for all Serper searches
+    app.state.http = create_http_client()
+    
+    # One limit on in-flight Serper/Gemini calls shared by every feed request
+    app.state.provider_limit = create_provider_limit()
+    
+    # Open the Gemini channels the endpoints use before the first request needs them
+    await awarm_up_models()
+    
+    # Build the OpenAPI document and model schemas now rather than on the
+    # first request a fresh worker serves
+    app.openapi()
+    for model in (QuestionResponse, ProfileResponse, NewsResponse, QueryResponse, FullPipelineResponse, HealthResponse):
+        model.model_json_schema()
+    NewsArticle.model_construct(title="", link="", source="", summary="", snippet="")
     logger.info("FastAPI application started successfully")
     
     yield
     
     # Shutdown
     logger.info("Shutting down FastAPI application...")
+    await app.state.http.aclose()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -111,18 +233,27 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Add CORS middleware
+# Add CORS middleware. CORS_ORIGINS is a comma-separated list of allowed
+# origins; credentials are only allowed once origins are pinned, since
+# browsers reject credentialed responses for a wildcard origin
+CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ORIGINS,
+    allow_credentials="*" not in CORS_ORIGINS,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    expose_headers=[CACHE_KEY_HEADER],
+    max_age=86400,  # Let browsers cache preflight results for a day
 )
 
+# News payloads are mostly long summary/snippet text and compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 @app.get("/", response_model=HealthResponse)
 async def root():
     """Root endpoint - health check"""
@@ -131,33 +262,26 @@ async def root():
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    try:
-        # Basic environment variable check
-        required_vars = ["GOOGLE_API_KEY", "SERPER_API_KEY"]
-        missing_vars = [var for var in required_vars if not os.getenv(var)]
-        
-        if missing_vars:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=f"Missing environment variables: {missing_vars}"
-            )
-        
-        return HealthResponse(status="healthy", message="All systems operational")
-    
-    except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+    # Environment variables are checked once at startup (see lifespan)
+    if not getattr(app.state, "env_ok", False):
+        logger.error("Health check failed: missing environment variables")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Service unhealthy"
         )
+    
+    return HealthResponse(status="healthy", message="All systems operational")
 
 @app.post("/generate-questions", response_model=QuestionResponse)
 async def generate_questions_endpoint(request: InterestRequest):
     """Generate probing questions based on user's initial interest"""
     try:
-        logger.info(f"Generating questions for interest: {request.interest_text[:50]}...")
+        logger.info("Generating questions for interest: %.50s...", request.interest_text)
         
-        questions = generate_probing_questions(request.interest_text)
+        questions = await singleflight(
+            request_key("generate-questions", request),
+            lambda: agenerate_probing_questions(request.interest_text)
+        )
         
         if not questions or not isinstance(questions, list):
             raise HTTPException(
@@ -165,13 +289,13 @@ async def generate_questions_endpoint(request: InterestRequest):
                 detail="Failed to generate valid questions"
             )
         
-        logger.info(f"Generated {len(questions)} questions successfully")
+        logger.info("Generated %d questions successfully", len(questions))
         return QuestionResponse(questions=questions)
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error generating questions: {str(e)}")
+        logger.error("Error generating questions: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while generating questions"
@@ -181,9 +305,12 @@ async def generate_questions_endpoint(request: InterestRequest):
 async def create_profile_endpoint(request: ProfileRequest):
     """Create user profile summary from initial interest and answers"""
     try:
-        logger.info(f"Creating profile for interest: {request.initial_interest[:50]}...")
+        logger.info("Creating profile for interest: %.50s...", request.initial_interest)
         
-        profile_summary = summarize_user_profile(request.initial_interest, request.answers)
+        profile_summary = await singleflight(
+            request_key("create-profile", request),
+            lambda: asummarize_user_profile(request.initial_interest, request.answers)
+        )
         
         if not profile_summary or profile_summary.strip() == "":
             raise HTTPException(
@@ -197,68 +324,114 @@ async def create_profile_endpoint(request: ProfileRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error creating profile: {str(e)}")
+        logger.error("Error creating profile: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while creating profile"
         )
 
 @app.post("/generate-news", response_model=NewsResponse)
-async def generate_news_endpoint(request: NewsRequest):
-    """Generate personalized news based on user profile"""
+async def generate_news_endpoint(request: NewsRequest, http_request: Request):
+    """Generate personalized news based on user profile.
+
+    Send `Accept: application/x-ndjson` to receive each article as its own
+    JSON line as soon as it has been summarized.
+    """
     try:
-        logger.info(f"Generating news for profile: {request.profile_summary[:50]}...")
+        logger.info("Generating news for profile: %.50s...", request.profile_summary)
+        
+        # Articles are cached for querying under a hash of the profile and language
+        cache_key = feed_cache_key(request.profile_summary, request.target_language)
         
-        articles = get_personalized_news(request.profile_summary, request.target_language)
+        if wants_stream(http_request):
+            async def article_stream():
+                articles = []
+                try:
+                    async for article in aget_personalized_news_stream(
+                        request.profile_summary, request.target_language, app.state.http, app.state.provider_limit
+                    ):
+                        articles.append(article)
+                        yield orjson.dumps(article) + b"\n"
+                except Exception as e:
+                    logger.error("Error streaming news: %s", e)
+                    return
+                
+                if not articles:
+                    logger.warning("No articles found for the given profile")
+                    return
+                
+                cache_feed(cache_key, articles)
+                logger.info("Streamed %d articles successfully", len(articles))
+            
+            return StreamingResponse(
+                article_stream(),
+                media_type=STREAM_MEDIA_TYPE,
+                headers={**STREAM_HEADERS, CACHE_KEY_HEADER: cache_key}
+            )
+        
+        articles = await aget_personalized_news(
+            request.profile_summary, request.target_language, app.state.http, app.state.provider_limit
+        )
+        assert isinstance(articles, list)
         
         if not articles:
             logger.warning("No articles found for the given profile")
             return NewsResponse(
                 articles=[],
-                profile_summary=request.profile_summary
+                profile_summary=request.profile_summary,
+                cache_key=cache_key
             )
         
-        # Store articles in cache for querying (using profile summary as key)
-        cache_key = f"{request.profile_summary}_{request.target_language}"
-        news_articles_cache[cache_key] = articles
+        cache_feed(cache_key, articles)
         
-        # Convert to Pydantic models
-        news_articles = [NewsArticle(**article) for article in articles]
-        
-        logger.info(f"Generated {len(news_articles)} articles successfully")
-        return NewsResponse(
-            articles=news_articles,
-            profile_summary=request.profile_summary
-        )
+        logger.info("Generated %d articles successfully", len(articles))
+        # Articles come straight from the tool layer, which always builds them
+        # with the NewsArticle fields, so skip re-validating them on the way out
+        return ORJSONResponse(content={
+            "articles": articles,
+            "profile_summary": request.profile_summary,
+            "cache_key": cache_key
+        })
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error generating news: {str(e)}")
+        logger.error("Error generating news: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while generating news"
         )
 
 @app.post("/query-news", response_model=QueryResponse)
-async def query_news_endpoint(request: QueryRequest):
-    """Query the news feed with a specific question"""
+async def query_news_endpoint(request: QueryRequest, http_request: Request):
+    """Query the news feed with a specific question.
+
+    Send `Accept: application/x-ndjson` to receive the answer as a stream of
+    `{"answer": "<chunk>"}` lines while the LLM is still generating it.
+    """
     try:
-        logger.info(f"Querying news with question: {request.question[:50]}...")
+        logger.info("Querying news with question: %.50s...", request.question)
         
-        # For simplicity, we'll use the most recent cache entry
-        # In a production system, you might want to implement a more sophisticated caching strategy
-        if not news_articles_cache:
+        articles = get_cached_feed(request.cache_key)
+        if not articles:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No news articles available. Please generate news first using /generate-news endpoint."
+                detail="No news articles available for this cache_key. Please generate news first using /generate-news endpoint."
             )
         
-        # Get the most recent articles (you might want to implement a better strategy)
-        most_recent_key = max(news_articles_cache.keys(), key=lambda k: len(news_articles_cache[k]))
-        articles = news_articles_cache[most_recent_key]
+        if wants_stream(http_request):
+            async def answer_stream():
+                try:
+                    async for chunk in batch_chunks(aquery_news_feed_stream(request.question, articles, request.target_language)):
+                        yield orjson.dumps({"answer": chunk}) + b"\n"
+                except Exception as e:
+                    logger.error("Error streaming answer: %s", e)
+                    return
+                logger.info("Query answered successfully")
+            
+            return StreamingResponse(answer_stream(), media_type=STREAM_MEDIA_TYPE, headers=STREAM_HEADERS)
         
-        answer = query_news_feed(request.question, articles, request.target_language)
+        answer = await aquery_news_feed(request.question, articles, request.target_language)
         
         if not answer or answer.strip() == "":
             raise HTTPException(
@@ -272,58 +445,58 @@ async def query_news_endpoint(request: QueryRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error querying news: {str(e)}")
+        logger.error("Error querying news: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while querying news"
         )
 
-class FullPipelineRequest(BaseModel):
+class FullPipelineRequest(LanguageMixin):
     initial_interest: str = Field(..., min_length=1, max_length=500, description="User's initial interest")
     answers: Dict[str, str] = Field(..., description="Dictionary of question-answer pairs")
-    target_language: str = Field(default="en", description="Target language code (ISO 639-1)")
-    
-    @validator('target_language')
-    def validate_language_code(cls, v):
-        valid_codes = ['en', 'es', 'fr', 'de', 'it', 'pt', 'nl', 'ru', 'ja', 'ko', 'zh', 'ar', 'hi']
-        if v not in valid_codes:
-            logger.warning(f"Language code '{v}' not in common codes list, but allowing it")
-        return v
 
 class FullPipelineResponse(BaseModel):
+    model_config = RESPONSE_CONFIG
     profile_summary: str = Field(..., description="Generated user profile summary")
     articles: List[NewsArticle] = Field(..., description="List of personalized news articles")
     article_count: int = Field(..., description="Number of articles generated")
+    cache_key: str = Field(..., description="Key identifying this news feed for /query-news")
 
 @app.post("/full-pipeline", response_model=FullPipelineResponse)
 async def full_pipeline_endpoint(request: FullPipelineRequest):
     """Complete pipeline: create profile and generate news in one call"""
     try:
-        logger.info(f"Running full pipeline for interest: {request.initial_interest[:50]}...")
+        logger.info("Running full pipeline for interest: %.50s...", request.initial_interest)
         
-        # Create profile
-        profile_summary = summarize_user_profile(request.initial_interest, request.answers)
+        async def run_pipeline():
+            # Create profile; the news stage depends on it, so it has to finish first
+            profile_summary = await asummarize_user_profile(request.initial_interest, request.answers)
+            
+            # Generate news (searches and summaries are fanned out concurrently)
+            articles = await aget_personalized_news(
+                profile_summary, request.target_language, app.state.http, app.state.provider_limit
+            )
+            assert isinstance(articles, list)
+            return profile_summary, articles
         
-        # Generate news
-        articles = get_personalized_news(profile_summary, request.target_language)
+        profile_summary, articles = await singleflight(request_key("full-pipeline", request), run_pipeline)
         
         # Cache articles
-        cache_key = f"{profile_summary}_{request.target_language}"
-        news_articles_cache[cache_key] = articles
-        
-        # Convert to response format
-        news_articles = [NewsArticle(**article) for article in articles]
+        cache_key = feed_cache_key(profile_summary, request.target_language)
+        cache_feed(cache_key, articles)
         
-        logger.info(f"Full pipeline completed with {len(news_articles)} articles")
+        logger.info("Full pipeline completed with %d articles", len(articles))
         
-        return FullPipelineResponse(
-            profile_summary=profile_summary,
-            articles=news_articles,
-            article_count=len(news_articles)
-        )
+        # Articles come from the trusted tool layer; skip re-validating them
+        return ORJSONResponse(content={
+            "profile_summary": profile_summary,
+            "articles": articles,
+            "article_count": len(articles),
+            "cache_key": cache_key
+        })
     
     except Exception as e:
-        logger.error(f"Error in full pipeline: {str(e)}")
+        logger.error("Error in full pipeline: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error in full pipeline"
@@ -333,7 +506,7 @@ async def full_pipeline_endpoint(request: FullPipelineRequest):
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc: HTTPException):
     """Custom HTTP exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail, "detail": str(exc.detail)}
     )
@@ -341,8 +514,8 @@ async def http_exception_handler(request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc: Exception):
     """General exception handler"""
-    logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"error": "Internal server error", "detail": "An unexpected error occurred"}
     )
@@ -350,10 +523,17 @@ async def general_exception_handler(request, exc: Exception):
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8080))
+    # Each worker is its own process with its own news feed cache, so a
+    # /query-news call can miss the feed /generate-news stored in another one.
+    # Stay single-process unless routing is sticky or the cache is shared.
+    workers = int(os.environ.get("WORKERS", 1))
     uvicorn.run(
         "api:app",
         host="0.0.0.0",
         port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
         log_level="info",
-        access_log=True
+        access_log=False
     )
\ No newline at end of file
@@ -1,5 +1,8 @@
+import html
+import threading
+
 import streamlit as st
-import tool
+from cachetools import TTLCache
 
 # Set page configuration
 st.set_page_config(
@@ -8,6 +11,110 @@ st.set_page_config(
     layout="wide"
 )
 
+def _tool():
+    # tool pulls in LangChain and the Google SDKs; import it only once a stage
+    # actually needs it so the first page renders without paying for that
+    import tool
+    return tool
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_up_models():
+    _tool().warm_up_models()
+
+
+# Cached wrappers around the tool calls. Streamlit re-runs this script on every
+# widget interaction, so identical inputs are served from memory instead of
+# going back to the LLM and search APIs.
+class _Fallback(Exception):
+    # Raised out of a cached function to hand back a fallback result without
+    # Streamlit memoizing it, so one transient API error isn't pinned for an hour
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+
+def _uncached_fallback(cached_call, *args):
+    try:
+        return cached_call(*args)
+    except _Fallback as fallback:
+        return fallback.result
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_probing_questions(interest_text):
+    tool = _tool()
+    questions = tool.generate_probing_questions(interest_text)
+    if questions == tool.FALLBACK_QUESTIONS:
+        raise _Fallback(questions)
+    return questions
+
+
+def cached_probing_questions(interest_text):
+    return _uncached_fallback(_cached_probing_questions, interest_text)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_user_profile(initial_interest, answer_items):
+    summary = _tool().summarize_user_profile(initial_interest, dict(answer_items))
+    if summary == initial_interest:  # summarize_user_profile's fallback
+        raise _Fallback(summary)
+    return summary
+
+
+def cached_user_profile(initial_interest, answers):
+    # Key on the sorted answers so the same answers always hit the same entry
+    return _uncached_fallback(_cached_user_profile, initial_interest, tuple(sorted(answers.items())))
+
+
+@st.cache_resource
+def _news_feed_cache():
+    # Finished feeds, shared across sessions for as long as the cached calls above
+    return TTLCache(maxsize=256, ttl=3600), threading.Lock()
+
+
+def stream_personalized_news(profile_summary, language_code, placeholder):
+    # Feeds are streamed rather than wrapped in st.cache_data so each article
+    # shows up in `placeholder` as soon as its summary is ready
+    cache, lock = _news_feed_cache()
+    key = (profile_summary, language_code)
+    with lock:
+        news_feed = cache.get(key)
+    if news_feed is not None:
+        return news_feed
+
+    news_feed = []
+    for item in _tool().iter_personalized_news(profile_summary, language_code):
+        news_feed.append(item)
+        placeholder.markdown(_news_feed_html(news_feed), unsafe_allow_html=True)
+
+    if news_feed:  # Don't serve an empty feed again on "Try Again"
+        with lock:
+            cache[key] = news_feed
+    return news_feed
+
+
+def _article_link_html(link):
+    # Search results are untrusted: only link out to web pages, never to
+    # javascript: or other schemes that raw HTML would happily run
+    if not link.lower().startswith(("http://", "https://")):
+        return ""
+    return (
+        f" &mdash; <a href=\"{html.escape(link, quote=True)}\" target=\"_blank\" "
+        f"rel=\"noopener noreferrer\">Read Full Article</a>"
+    )
+
+
+def _news_feed_html(news_feed):
+    # One pre-built HTML block replaces four widgets per article
+    return "\n".join(
+        f"<h3>{i}. {html.escape(item['title'])}</h3>"
+        f"<p><b>Source:</b> {html.escape(item['source'])}{_article_link_html(item['link'])}</p>"
+        f"<p>{html.escape(item['summary'])}</p><hr/>"
+        for i, item in enumerate(news_feed, 1)
+    )
+
+
 # Initialize session state variables
 if 'stage' not in st.session_state:
     st.session_state.stage = 'initial_input'
@@ -75,7 +182,7 @@ if st.session_state.stage == 'initial_input':
             
             with st.spinner("Analyzing your interests..."):
                 try:
-                    st.session_state.probing_questions = tool.generate_probing_questions(interest_input)
+                    st.session_state.probing_questions = cached_probing_questions(interest_input)
                 except Exception as e:
                     st.error(f"An error occurred while generating questions: {e}")
                     st.session_state.probing_questions = []
@@ -134,7 +241,7 @@ elif st.session_state.stage == 'news_display':
         # Generate profile summary if it doesn't exist yet
         if not st.session_state.profile_summary:
             with st.spinner("Creating your personalized profile..."):
-                st.session_state.profile_summary = tool.summarize_user_profile(
+                st.session_state.profile_summary = cached_user_profile(
                     st.session_state.initial_interest,
                     st.session_state.probing_answers
                 )
@@ -145,33 +252,24 @@ elif st.session_state.stage == 'news_display':
 
         # Generate news feed if it doesn't exist yet
         if not st.session_state.news_feed:
+            feed_placeholder = st.empty()
             with st.spinner("🔍 Curating your news... Please wait, this may take a moment."):
                 try:
-                    st.session_state.news_feed = tool.get_personalized_news(
+                    st.session_state.news_feed = stream_personalized_news(
                         st.session_state.profile_summary,
-                        st.session_state.language_code
+                        st.session_state.language_code,
+                        feed_placeholder
                     )
                 except Exception as e:
                     st.error(f"Error generating news feed: {e}")
                     st.session_state.news_feed = []
+            feed_placeholder.empty()  # The full feed is rendered below
 
         # Display the generated news feed
         if st.session_state.news_feed:
             st.success(f"Found {len(st.session_state.news_feed)} personalized articles for you!")
             
-            for i, item in enumerate(st.session_state.news_feed, 1):
-                with st.container():
-                    st.subheader(f"{i}. {item['title']}")
-                    
-                    # Create columns for source and link
-                    col1, col2 = st.columns([2, 1])
-                    with col1:
-                        st.markdown(f"**Source:** {item['source']}")
-                    with col2:
-                        st.markdown(f"[Read Full Article]({item['link']})")
-                    
-                    st.write(item['summary'])
-                    st.divider()
+            st.markdown(_news_feed_html(st.session_state.news_feed), unsafe_allow_html=True)
             
             # Conversational Q&A Section
             st.header("💬 Ask About Your News")
@@ -187,7 +285,7 @@ elif st.session_state.stage == 'news_display':
                 if question.strip():
                     with st.spinner("🔍 Searching for an answer..."):
                         try:
-                            answer = tool.query_news_feed(
+                            answer = _tool().query_news_feed(
                                 question,
                                 st.session_state.news_feed,
                                 st.session_state.language_code
@@ -238,4 +336,8 @@ elif st.session_state.stage == 'news_display':
 else:
     st.error(f"Unknown stage: {st.session_state.stage}")
     st.session_state.stage = 'initial_input'
-    st.rerun()
\ No newline at end of file
+    st.rerun()
+
+# Open the Gemini connections in the background once per server process. This
+# runs last so the first page is already drawn when tool is first imported.
+_warm_up_models()
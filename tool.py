@@ -1,22 +1,24 @@
-try:
-    import asyncio
-    loop = asyncio.get_event_loop()
-    if hasattr(loop, '_nest_patched') or 'IPython' in str(type(loop)):
-        import nest_asyncio
-        nest_asyncio.apply()
-except:
-    pass
-
 import os
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
+import httpx
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from langchain.globals import set_llm_cache
+from langchain_community.cache import SQLAlchemyCache
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import PromptTemplate
-from langchain.chains import RetrievalQA
-from langchain_community.vectorstores import Chroma
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain.schema.document import Document
-from langchain_community.utilities import GoogleSerperAPIWrapper
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError, OperationalError
 import re
 import json
 
@@ -30,6 +32,17 @@ if not GOOGLE_API_KEY:
 if not SERPER_API_KEY:
     raise ValueError("FATAL ERROR: SERPER_API_KEY not found in .env file.")
 
+SERPER_NEWS_URL = "https://google.serper.dev/news"
+SERPER_TIMEOUT = 30  # seconds
+
+# Upper bound on in-flight Serper/Gemini calls across all async feed requests
+# of a process (see create_provider_limit)
+MAX_CONCURRENCY = 16
+MAX_QUERIES = 4  # Limit to 4 queries to avoid rate limits
+MAX_ARTICLES = 4
+# Profiles shorter than this are searched as-is, without generating keywords
+SHORT_PROFILE_WORDS = 20
+
 try:
     llm = ChatGoogleGenerativeAI(
         model="gemini-2.5-flash",
@@ -37,6 +50,14 @@ try:
         temperature=0.7
     )
 
+    # Lighter model for the short, well-constrained tasks (probing questions,
+    # profile summary, search keywords, article summaries); llm is kept for Q&A
+    llm_flash = ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash-lite",
+        google_api_key=GOOGLE_API_KEY,
+        temperature=0.3
+    )
+
     embeddings = GoogleGenerativeAIEmbeddings(
         model="models/text-embedding-004",
         google_api_key=GOOGLE_API_KEY
@@ -44,10 +65,254 @@ try:
 except Exception as e:
     raise RuntimeError(f"Failed to initialize Google AI services. Please check your GOOGLE_API_KEY. Error: {e}")
 
-def generate_probing_questions(interest_text: str) -> list[str]:
-    prompt = PromptTemplate(
-        input_variables=["interest_text"],
-        template="""Based on the user's initial interest description: "{interest_text}",
+class SharedSQLiteCache(SQLAlchemyCache):
+    """LangChain's SQLite LLM cache, made safe to share between callers.
+
+    Concurrent identical prompts race to store the same key, and every API
+    worker process opens the same database file. A failed lookup counts as a
+    miss and a failed store is dropped, so the cache can never fail the LLM
+    call that uses it. WAL mode lets workers read while another one writes.
+    """
+
+    def __init__(self, database_path: str):
+        engine = create_engine(f"sqlite:///{database_path}", connect_args={"timeout": 5})
+
+        @event.listens_for(engine, "connect")
+        def _enable_wal(dbapi_connection, _):
+            dbapi_connection.execute("PRAGMA journal_mode=WAL")
+
+        try:
+            super().__init__(engine)
+        except OperationalError:
+            # Another worker created the table between the existence check and CREATE TABLE
+            super().__init__(engine)
+
+    def lookup(self, prompt: str, llm_string: str):
+        try:
+            return super().lookup(prompt, llm_string)
+        except OperationalError as e:
+            print(f"Error reading LLM cache: {e}")
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val) -> None:
+        try:
+            super().update(prompt, llm_string, return_val)
+        except IntegrityError:
+            pass  # Another caller stored the same completion first
+        except OperationalError as e:
+            print(f"Skipped LLM cache write: {e}")
+
+
+# Identical prompts are answered from an on-disk cache instead of calling Gemini
+# again; entries are keyed by prompt and model settings and survive restarts
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".langchain.db")
+set_llm_cache(SharedSQLiteCache(LLM_CACHE_PATH))
+
+
+WARM_UP_TIMEOUT = 10  # seconds
+
+
+def _warm_up_probe(model: ChatGoogleGenerativeAI) -> ChatGoogleGenerativeAI:
+    # A separate uncached model, so the LLM cache cannot answer the probe, that
+    # sends through the real model's sync and async clients
+    probe = ChatGoogleGenerativeAI(
+        model=model.model,
+        google_api_key=GOOGLE_API_KEY,
+        max_output_tokens=1,
+        cache=False
+    )
+    probe.client = model.client
+    probe.async_client = model.async_client
+    return probe
+
+
+def _warm_up(probe: ChatGoogleGenerativeAI) -> None:
+    # A one-token request sets up the model's connection before the first real call needs it
+    try:
+        probe.invoke("ping")
+    except Exception as e:
+        print(f"Error warming up {probe.model}: {e}")
+
+
+def warm_up_models() -> None:
+    """Open the sync Gemini channels in the background, for callers of the sync functions"""
+    # Probes are built here rather than on the worker threads: the model
+    # constructor needs the calling thread's event loop
+    for model in (llm_flash, llm):
+        threading.Thread(target=_warm_up, args=(_warm_up_probe(model),), daemon=True).start()
+
+
+async def awarm_up_models() -> None:
+    """Async variant of warm_up_models for the async clients, meant to be awaited on the serving event loop"""
+    async def warm_up(probe: ChatGoogleGenerativeAI):
+        try:
+            await asyncio.wait_for(probe.ainvoke("ping"), WARM_UP_TIMEOUT)
+        except Exception as e:
+            print(f"Error warming up {probe.model}: {e!r}")
+
+    await asyncio.gather(*(warm_up(_warm_up_probe(model)) for model in (llm_flash, llm)))
+
+
+class EmbeddingCache:
+    """Memoizes embeddings per text so each text is embedded only once.
+
+    Wraps an embeddings model and exposes its embed_documents/aembed_documents
+    and embed_query/aembed_query methods. Documents and queries are embedded
+    differently, so they are cached apart. Texts missing from the cache are
+    embedded together in one batched request; each cache keeps at most
+    `max_entries` float32 vectors, least recently used evicted first.
+    """
+
+    def __init__(self, embedder, max_entries: int = 4096):
+        self.embedder = embedder
+        self.max_entries = max_entries
+        self._documents: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._queries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cached(self, store: OrderedDict, texts: list[str]) -> tuple[list, list[str]]:
+        """Return the cached vector (or None) per text, and the distinct texts still to embed"""
+        with self._lock:
+            cached = []
+            for text in texts:
+                vector = store.get(text)
+                if vector is not None:
+                    store.move_to_end(text)
+                cached.append(vector)
+        misses = list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+        return cached, misses
+
+    def _merge(self, store: OrderedDict, texts: list[str], cached: list, misses: list[str], vectors: list) -> list[np.ndarray]:
+        # float32 arrays take about a ninth of the memory of lists of Python floats
+        computed = {text: np.asarray(vector, dtype=np.float32) for text, vector in zip(misses, vectors)}
+        with self._lock:
+            store.update(computed)
+            while len(store) > self.max_entries:
+                store.popitem(last=False)
+        return [computed[text] if vector is None else vector for text, vector in zip(texts, cached)]
+
+    def embed_documents(self, texts: list[str]) -> list[np.ndarray]:
+        cached, misses = self._cached(self._documents, texts)
+        vectors = self.embedder.embed_documents(misses) if misses else []
+        return self._merge(self._documents, texts, cached, misses, vectors)
+
+    async def aembed_documents(self, texts: list[str]) -> list[np.ndarray]:
+        cached, misses = self._cached(self._documents, texts)
+        vectors = await self.embedder.aembed_documents(misses) if misses else []
+        return self._merge(self._documents, texts, cached, misses, vectors)
+
+    def embed_query(self, text: str) -> np.ndarray:
+        cached, misses = self._cached(self._queries, [text])
+        vectors = [self.embedder.embed_query(text)] if misses else []
+        return self._merge(self._queries, [text], cached, misses, vectors)[0]
+
+    async def aembed_query(self, text: str) -> np.ndarray:
+        cached, misses = self._cached(self._queries, [text])
+        vectors = [await self.embedder.aembed_query(text)] if misses else []
+        return self._merge(self._queries, [text], cached, misses, vectors)[0]
+
+
+# Profiles, article descriptions, feed documents and follow-up questions recur across requests
+embedding_cache = EmbeddingCache(embeddings)
+
+
+def _normalize_rows(vectors) -> np.ndarray:
+    """Stack vectors into a float32 matrix of unit rows, so dot products are cosine similarities"""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+class SemanticCache:
+    """Reuses completions for inputs that are near-duplicates of earlier ones.
+
+    Inputs are embedded and compared by cosine similarity with earlier inputs
+    in the same namespace, and a stored completion is returned when the best
+    match reaches `threshold`. Namespaces keep tasks (and target languages)
+    apart; each holds at most `max_entries` entries, oldest evicted first.
+    """
+
+    def __init__(self, embedder, threshold: float = 0.92, max_entries: int = 512):
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors: dict[str, np.ndarray] = {}
+        self._completions: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def _match(self, namespace: str, vectors: np.ndarray) -> list[str | None]:
+        with self._lock:
+            matrix = self._vectors.get(namespace)
+            if matrix is None:
+                return [None] * len(vectors)
+            completions = self._completions[namespace]
+            scores = vectors @ matrix.T
+            best = scores.argmax(axis=1)
+            return [
+                completions[j] if scores[i, j] >= self.threshold else None
+                for i, j in enumerate(best)
+            ]
+
+    def lookup(self, namespace: str, texts: list[str]) -> tuple[list, list[str | None]]:
+        """Embed `texts` in one call and return (vectors, cached completion or None per text)"""
+        try:
+            vectors = _normalize_rows(self.embedder.embed_documents(texts))
+        except Exception as e:
+            print(f"Error embedding for semantic cache: {e}")
+            return [None] * len(texts), [None] * len(texts)
+        return list(vectors), self._match(namespace, vectors)
+
+    async def alookup(self, namespace: str, texts: list[str]) -> tuple[list, list[str | None]]:
+        try:
+            vectors = _normalize_rows(await self.embedder.aembed_documents(texts))
+        except Exception as e:
+            print(f"Error embedding for semantic cache: {e}")
+            return [None] * len(texts), [None] * len(texts)
+        return list(vectors), self._match(namespace, vectors)
+
+    def update(self, namespace: str, vector: np.ndarray | None, completion: str) -> None:
+        """Store `completion` under a vector returned by lookup (no-op if embedding failed)"""
+        if vector is None:
+            return
+        with self._lock:
+            matrix = self._vectors.get(namespace)
+            completions = self._completions.setdefault(namespace, [])
+            row = vector[np.newaxis, :]
+            matrix = row if matrix is None else np.vstack([matrix, row])
+            completions.append(completion)
+            if len(completions) > self.max_entries:
+                matrix = matrix[-self.max_entries:]
+                del completions[:-self.max_entries]
+            self._vectors[namespace] = matrix
+
+
+# Article summaries are the calls most often repeated with near-identical
+# input (syndicated articles). Keyword generation is deliberately left to the
+# exact-match LLM cache: profiles are written to one template, so two users
+# who differ only in the company or topic they follow can score as near
+# matches, and sharing keywords would hand one user the other's feed.
+semantic_cache = SemanticCache(embedding_cache)
+
+
+def _summary_cache_namespace(target_language: str) -> str:
+    return f"summary:{target_language}"
+
+
+def _response_text(response) -> str:
+    return response.content if hasattr(response, 'content') else str(response)
+
+
+# Fallback questions if parsing fails
+FALLBACK_QUESTIONS = [
+    "Could you be more specific about the topics?",
+    "Are there any particular companies or people to follow?",
+    "Which regions are you most interested in?"
+]
+
+
+PROBING_PROMPT = PromptTemplate(
+    input_variables=["interest_text"],
+    template="""Based on the user's initial interest description given at the end,
         generate 3-4 short, specific questions to better understand their preferences.
         Focus on aspects like:
         - Specific sub-topics or companies.
@@ -59,65 +324,112 @@ def generate_probing_questions(interest_text: str) -> list[str]:
 
         Do not include any other text or explanation.
 
+        USER'S INTEREST: "{interest_text}"
+
         QUESTIONS:
         """
-    )
-    
+)
+
+
+def _parse_json_list(text: str):
+    """Parse the JSON array in an LLM response, or return None if there is none"""
+    text = text.strip()
+    try:
+        # Fast path: the model returned a bare JSON array as instructed
+        return json.loads(text)
+    except ValueError:
+        pass
+    # Otherwise take the outermost [...] span, e.g. from a fenced code block
+    json_match = re.search(r'\[.*\]', text, re.DOTALL)
+    if not json_match:
+        return None
+    try:
+        return json.loads(json_match.group())
+    except ValueError:
+        return None
+
+
+def _is_string_list(value) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def _extract_questions(response_text: str) -> list[str] | None:
+    questions = _parse_json_list(response_text)
+    return questions if _is_string_list(questions) else None
+
+
+def generate_probing_questions(interest_text: str) -> list[str]:
     try:
         # Use invoke instead of run
-        response = llm.invoke(prompt.format(interest_text=interest_text))
-        response_text = response.content if hasattr(response, 'content') else str(response)
-        
-        # Try to extract JSON array from response
-        json_match = re.search(r'\[.*?\]', response_text, re.DOTALL)
-        if json_match:
-            questions = json.loads(json_match.group())
-            if isinstance(questions, list) and all(isinstance(q, str) for q in questions):
-                return questions
+        response = llm_flash.invoke(PROBING_PROMPT.format(interest_text=interest_text))
+        questions = _extract_questions(_response_text(response))
+        if questions is not None:
+            return questions
     except Exception as e:
         print(f"Error generating probing questions: {e}")
-    
-    # Fallback questions if parsing fails
-    return [
-        "Could you be more specific about the topics?",
-        "Are there any particular companies or people to follow?",
-        "Which regions are you most interested in?"
-    ]
 
+    return list(FALLBACK_QUESTIONS)
 
-def summarize_user_profile(initial_interest: str, answers: dict) -> str:
-    answers_str = "\n".join([f"- {q}: {a}" for q, a in answers.items() if a and a.strip()])
-    prompt = PromptTemplate(
-        input_variables=["initial_interest", "answers_str"],
-        template="""Create a concise, one-paragraph summary of a user's news preferences.
+
+async def agenerate_probing_questions(interest_text: str) -> list[str]:
+    """Async variant of generate_probing_questions"""
+    try:
+        response = await llm_flash.ainvoke(PROBING_PROMPT.format(interest_text=interest_text))
+        questions = _extract_questions(_response_text(response))
+        if questions is not None:
+            return questions
+    except Exception as e:
+        print(f"Error generating probing questions: {e}")
+
+    return list(FALLBACK_QUESTIONS)
+
+
+PROFILE_PROMPT = PromptTemplate(
+    input_variables=["initial_interest", "answers_str"],
+    template="""Create a concise, one-paragraph summary of a user's news preferences.
         This summary will be used to generate keywords for a news API.
 
+        Synthesize the user's initial interest and answers below into a clear profile summary.
+        For example: "The user is interested in the latest AI developments, specifically focusing on
+        Nvidia and Google's recent product launches and financial performance in the US market."
+
         User's initial interest: "{initial_interest}"
         User's answers to clarifying questions:
         {answers_str}
 
-        Synthesize this information into a clear profile summary.
-        For example: "The user is interested in the latest AI developments, specifically focusing on
-        Nvidia and Google's recent product launches and financial performance in the US market."
-
         PROFILE SUMMARY:
         """
-    )
-    
+)
+
+
+def _format_answers(answers: dict) -> str:
+    return "\n".join([f"- {q}: {a}" for q, a in answers.items() if a and a.strip()])
+
+
+def summarize_user_profile(initial_interest: str, answers: dict) -> str:
     try:
         # Use invoke instead of run
-        response = llm.invoke(prompt.format(initial_interest=initial_interest, answers_str=answers_str))
-        summary = response.content if hasattr(response, 'content') else str(response)
+        response = llm_flash.invoke(PROFILE_PROMPT.format(initial_interest=initial_interest, answers_str=_format_answers(answers)))
+        summary = _response_text(response)
         return summary.strip()
     except Exception as e:
         print(f"Error generating profile summary: {e}")
         return initial_interest  # Fallback to original interest
 
 
-def get_personalized_news(profile_summary: str, target_language: str) -> list[dict]:
-    query_gen_prompt = PromptTemplate(
-        input_variables=["profile_summary"],
-        template="""Based on this user profile: "{profile_summary}",
+async def asummarize_user_profile(initial_interest: str, answers: dict) -> str:
+    """Async variant of summarize_user_profile"""
+    try:
+        response = await llm_flash.ainvoke(PROFILE_PROMPT.format(initial_interest=initial_interest, answers_str=_format_answers(answers)))
+        return _response_text(response).strip()
+    except Exception as e:
+        print(f"Error generating profile summary: {e}")
+        return initial_interest  # Fallback to original interest
+
+
+QUERY_GEN_PROMPT = PromptTemplate(
+    input_variables=["profile_summary"],
+    template="""Based on the user profile given at the end,
         generate 3 diverse and specific keywords or short phrases for a news search.
         Return ONLY a JSON array of strings.
 
@@ -125,180 +437,564 @@ def get_personalized_news(profile_summary: str, target_language: str) -> list[di
 
         Do not include any other text or explanation.
 
+        USER PROFILE: "{profile_summary}"
+
         KEYWORDS:
         """
-    )
-    
+)
+
+
+SUMMARIZATION_PROMPT = PromptTemplate(
+    input_variables=["article_description", "target_language"],
+    template="""Summarize the following news article description in 3-4 sentences.
+        The tone should be neutral and informative.
+        Write the final summary in the language with the ISO 639-1 code given below.
+
+        LANGUAGE: '{target_language}'
+
+        ARTICLE DESCRIPTION:
+        "{article_description}"
+
+        SUMMARY:
+        """
+)
+
+
+BATCH_SUMMARIZATION_PROMPT = PromptTemplate(
+    input_variables=["target_language", "articles"],
+    template="""Summarize each of the following news article descriptions in 3-4 sentences.
+        The tone should be neutral and informative.
+        Write every summary in the language with the ISO 639-1 code given below.
+
+        Return ONLY a JSON array of strings with exactly one summary per article,
+        in the order the articles are given. Do not include any other text or explanation.
+
+        LANGUAGE: '{target_language}'
+
+        ARTICLE DESCRIPTIONS:
+        {articles}
+
+        SUMMARIES:
+        """
+)
+
+
+def _batch_summary_prompt(descriptions: list[str], target_language: str) -> str:
+    articles = "\n\n".join(f'{i}. "{description}"' for i, description in enumerate(descriptions, 1))
+    return BATCH_SUMMARIZATION_PROMPT.format(target_language=target_language, articles=articles)
+
+
+def _extract_summaries(response_text: str, count: int) -> list[str] | None:
+    summaries = _parse_json_list(response_text)
+    if not _is_string_list(summaries) or len(summaries) != count or not all(summary.strip() for summary in summaries):
+        return None
+    return summaries
+
+
+def _summarize_article(description: str, target_language: str) -> str | None:
+    """Summarize one article; None means the call failed and the next candidate should be tried"""
     try:
-        # Use invoke instead of run
-        response = llm.invoke(query_gen_prompt.format(profile_summary=profile_summary))
-        queries_str = response.content if hasattr(response, 'content') else str(response)
-        
-        # Try to extract JSON array from response
-        json_match = re.search(r'\[.*?\]', queries_str, re.DOTALL)
-        if json_match:
-            queries = json.loads(json_match.group())
-            if isinstance(queries, list) and all(isinstance(q, str) for q in queries):
-                pass  # queries is valid
-            else:
-                raise ValueError("Invalid query format")
-        else:
-            raise ValueError("No JSON array found in response")
+        response = llm_flash.invoke(SUMMARIZATION_PROMPT.format(article_description=description, target_language=target_language))
+        return _response_text(response)
+    except Exception as e:
+        print(f"Error summarizing article: {e}")
+        return None
+
+
+def _summarize_batch(descriptions: list[str], target_language: str) -> list[str] | None:
+    """Summarize several articles with one LLM call; None means fall back to one call per article"""
+    try:
+        response = llm_flash.invoke(_batch_summary_prompt(descriptions, target_language))
+        return _extract_summaries(_response_text(response), len(descriptions))
+    except Exception as e:
+        print(f"Error summarizing articles in one call: {e}")
+        return None
+
+
+def _extract_queries(queries_str: str) -> list[str]:
+    queries = _parse_json_list(queries_str)
+    if queries is None:
+        raise ValueError("No JSON array found in response")
+    if not _is_string_list(queries):
+        raise ValueError("Invalid query format")
+    return queries
+
+
+def _search_queries(queries: list[str], profile_summary: str) -> list[str]:
+    """Unique queries to search, with the profile summary as a fallback query"""
+    # The LLM sometimes repeats a keyword, possibly in other casing or spacing;
+    # searching it twice only returns duplicates. The first spelling is kept.
+    unique = {}
+    for query in [*queries, profile_summary]:
+        query = query.strip()
+        if query:
+            unique.setdefault(" ".join(query.lower().split()), query)
+    return list(unique.values())[:MAX_QUERIES] or [profile_summary]
+
+
+def _needs_keywords(profile_summary: str) -> bool:
+    # A short profile already makes a good search query on its own
+    return len(profile_summary.split()) >= SHORT_PROFILE_WORDS
+
+
+def _generate_queries(profile_summary: str) -> list[str]:
+    """Search keywords for a profile from the LLM ([] on failure)"""
+    try:
+        response = llm_flash.invoke(QUERY_GEN_PROMPT.format(profile_summary=profile_summary))
+        return _extract_queries(_response_text(response))
     except Exception as e:
         print(f"Error generating search queries: {e}")
-        queries = [profile_summary]  # Fallback to profile summary
+        return []  # _search_queries falls back to the profile summary
 
-    # Ensure we have the profile summary as a fallback query
-    if profile_summary not in queries:
-        queries.append(profile_summary)
 
+def _collect_articles(queries: list[str], query_results: list) -> list[dict]:
+    """Merge per-query Serper results (or the errors raised instead), dropping articles whose link or title was already seen"""
     all_articles = []
     seen_urls = set()
+    seen_titles = set()
 
-    try:
-        # Initialize search with proper parameters
-        search = GoogleSerperAPIWrapper(
-            type="news", 
-            serper_api_key=SERPER_API_KEY, 
-            k=5  # Use k instead of num for newer versions
-        )
-    except Exception as e:
-        print(f"Failed to initialize GoogleSerperAPIWrapper: {e}")
-        return []
+    for query, results in zip(queries, query_results):
+        if isinstance(results, Exception):
+            print(f"Error fetching or parsing news for query '{query}': {results}")
+        elif "news" in results and results["news"]:
+            for article in results["news"]:
+                link = article.get("link", "")
+                # Syndicated stories show up under several links with the same headline
+                title = article.get("title", "").strip().lower()
+                if link and link not in seen_urls and not (title and title in seen_titles):
+                    all_articles.append(article)
+                    seen_urls.add(link)
+                    if title:
+                        seen_titles.add(title)
+        else:
+            print(f"No news found in API response for query: '{query}'")
 
-    for query in queries[:4]:  # Limit to 4 queries to avoid rate limits
-        print(f"Searching for news with query: '{query}'")
-        try:
-            results = search.results(query)
-            
-            if "news" in results and results["news"]:
-                for article in results["news"]:
-                    link = article.get("link", "")
-                    if link and link not in seen_urls:
-                        all_articles.append(article)
-                        seen_urls.add(link)
+    return all_articles
+
+
+def _article_description(article: dict) -> str:
+    return article.get("snippet", article.get("title", ""))
+
+
+def _is_summarizable(description: str) -> bool:
+    return bool(description) and description.strip() != "" and "[Removed]" not in description
+
+
+def _summary_candidates(all_articles: list[dict]) -> list[tuple[dict, str]]:
+    candidates = []
+    for article in all_articles:
+        description = _article_description(article)
+        if _is_summarizable(description):
+            candidates.append((article, description))
+    return candidates
+
+
+def _news_item(article: dict, description: str, summary: str) -> dict:
+    return {
+        "title": article.get("title", "No Title"),
+        "link": article.get("link", "#"),
+        "source": article.get("source", "Unknown"),
+        "summary": summary.strip(),
+        "snippet": description
+    }
+
+
+class _SummaryWaves:
+    """Decides which candidate articles of a feed get summarized.
+
+    Candidates are taken in waves of as many articles as the feed still
+    needs, so a failed summary is replaced by the next candidate and no more
+    than MAX_ARTICLES summaries are paid for. Callers make the cache lookups
+    and LLM calls, on threads or on the event loop; this class only tracks
+    the feed and stores what they produce.
+    """
+
+    def __init__(self, all_articles: list[dict], target_language: str):
+        self.candidates = _summary_candidates(all_articles)
+        self.cache_namespace = _summary_cache_namespace(target_language)
+        self.produced = 0
+
+    def next_wave(self) -> list[tuple[dict, str]]:
+        """The next (article, description) pairs to summarize; empty once the feed is done"""
+        needed = MAX_ARTICLES - self.produced
+        if needed <= 0:
+            return []
+        wave, self.candidates = self.candidates[:needed], self.candidates[needed:]
+        return wave
+
+    def split(self, wave: list[tuple[dict, str]], vectors: list, summaries: list[str | None]) -> tuple[list[dict], list[tuple]]:
+        """News items for the semantic cache hits, and (article, description, vector) per miss"""
+        hits, misses = [], []
+        for (article, description), vector, summary in zip(wave, vectors, summaries):
+            if summary is None:
+                misses.append((article, description, vector))
             else:
-                print(f"No news found in API response for query: '{query}'")
+                self.produced += 1
+                hits.append(_news_item(article, description, summary))
+        return hits, misses
 
-        except Exception as e:
-            print(f"Error fetching or parsing news for query '{query}': {e}")
-            continue
+    @staticmethod
+    def batchable(misses: list[tuple]) -> bool:
+        # A batched request only saves calls when there are several misses
+        return len(misses) > 1
+
+    def store(self, miss: tuple, summary: str) -> dict:
+        article, description, vector = miss
+        semantic_cache.update(self.cache_namespace, vector, summary)
+        self.produced += 1
+        return _news_item(article, description, summary)
+
+
+def _serper_payload(query: str) -> dict:
+    # Same request GoogleSerperAPIWrapper(type="news", k=5) would send
+    return {"q": query, "gl": "us", "hl": "en", "num": 5}
+
+
+def _create_serper_session() -> requests.Session:
+    """Keep-alive session for the synchronous Serper searches, retrying transient failures"""
+    session = requests.Session()
+    retries = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None  # Searches are safe to repeat even though they are POSTs
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_QUERIES, max_retries=retries))
+    session.headers.update({"X-API-KEY": SERPER_API_KEY, "Content-Type": "application/json"})
+    return session
+
+
+serper_session = _create_serper_session()
+
+
+def _fetch_topic(query: str) -> dict:
+    print(f"Searching for news with query: '{query}'")
+    response = serper_session.post(SERPER_NEWS_URL, json=_serper_payload(query), timeout=SERPER_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+def iter_personalized_news(profile_summary: str, target_language: str):
+    """Generator variant of get_personalized_news yielding each news item as soon as its summary is ready"""
+    queries = _search_queries(_generate_queries(profile_summary) if _needs_keywords(profile_summary) else [], profile_summary)
+
+    # The searches are independent and network-bound, so overlap their round-trips
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        futures = [executor.submit(_fetch_topic, query) for query in queries]
+    all_articles = _collect_articles(queries, [future.exception() or future.result() for future in futures])
 
     if not all_articles:
         print("No news found after trying all queries.")
-        return []
+        return
 
-    news_items = []
-    summarization_prompt = PromptTemplate(
-        input_variables=["article_description", "target_language"],
-        template="""Summarize the following news article description in 3-4 sentences.
-        The tone should be neutral and informative.
-        Translate the final summary into the language with the ISO 639-1 code: '{target_language}'.
+    waves = _SummaryWaves(all_articles, target_language)
+    with ThreadPoolExecutor(max_workers=MAX_ARTICLES) as executor:
+        while wave := waves.next_wave():
+            vectors, summaries = semantic_cache.lookup(waves.cache_namespace, [description for _, description in wave])
+            hits, misses = waves.split(wave, vectors, summaries)
+            yield from hits
 
-        ARTICLE DESCRIPTION:
-        "{article_description}"
+            # Summarize the misses in one request, falling back to concurrent
+            # per-article requests if that fails
+            batch = _summarize_batch([description for _, description, _ in misses], target_language) if waves.batchable(misses) else None
+            if batch is not None:
+                for miss, summary in zip(misses, batch):
+                    yield waves.store(miss, summary)
+                continue
 
-        SUMMARY:
-        """
+            futures = {executor.submit(_summarize_article, miss[1], target_language): miss for miss in misses}
+            for future in as_completed(futures):
+                summary = future.result()
+                if summary is not None:
+                    yield waves.store(futures[future], summary)
+
+
+def get_personalized_news(profile_summary: str, target_language: str) -> list[dict]:
+    return list(iter_personalized_news(profile_summary, target_language))
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Pooled HTTP/2 client meant to be shared by every async search in the process"""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        timeout=SERPER_TIMEOUT
     )
 
-    for article in all_articles:
-        description = article.get("snippet", article.get("title", ""))
 
-        if not description or description.strip() == "" or "[Removed]" in description:
-            continue
+def create_provider_limit() -> asyncio.Semaphore:
+    """Semaphore bounding in-flight Serper/Gemini calls, meant to be shared by every async request in the process"""
+    return asyncio.Semaphore(MAX_CONCURRENCY)
 
-        try:
-            # Use invoke instead of run
-            response = llm.invoke(summarization_prompt.format(
-                article_description=description, 
-                target_language=target_language
-            ))
-            summary = response.content if hasattr(response, 'content') else str(response)
-            
-            news_items.append({
-                "title": article.get("title", "No Title"),
-                "link": article.get("link", "#"),
-                "source": article.get("source", "Unknown"),
-                "summary": summary.strip(),
-                "snippet": description
-            })
-            
-            # Stop once we have 4 successfully summarized articles
-            if len(news_items) >= 4:
-                break
-                
-        except Exception as e:
-            print(f"Error summarizing article: {e}")
-            continue
 
-    return news_items
+async def _afetch_topic(client: httpx.AsyncClient, query: str, semaphore: asyncio.Semaphore) -> dict:
+    """Async variant of _fetch_topic"""
+    async with semaphore:
+        print(f"Searching for news with query: '{query}'")
+        response = await client.post(
+            SERPER_NEWS_URL,
+            headers={"X-API-KEY": SERPER_API_KEY, "Content-Type": "application/json"},
+            json=_serper_payload(query)
+        )
+        response.raise_for_status()
+        return response.json()
 
 
-def query_news_feed(question: str, news_articles: list[dict], target_language: str) -> str:
-    if not news_articles:
-        return "The news feed hasn't been generated yet. Please generate the news first."
+async def _agenerate_queries(profile_summary: str, semaphore: asyncio.Semaphore) -> list[str]:
+    """Async variant of _generate_queries"""
+    try:
+        async with semaphore:
+            response = await llm_flash.ainvoke(QUERY_GEN_PROMPT.format(profile_summary=profile_summary))
+        return _extract_queries(_response_text(response))
+    except Exception as e:
+        print(f"Error generating search queries: {e}")
+        return []
+
 
+async def _asummarize_article(description: str, target_language: str, semaphore: asyncio.Semaphore) -> str | None:
+    """Async variant of _summarize_article"""
     try:
-        # Create documents from news articles
-        documents = [
-            Document(
-                page_content=f"Title: {article['title']}\nSummary: {article['summary']}",
-                metadata={"source": article['source'], "link": article['link']}
-            ) for article in news_articles
-        ]
-
-        # Create vector store with specific configuration to avoid tenant issues
-        vector_store = Chroma.from_documents(
-            documents, 
-            embeddings,
-            collection_name=f"news_collection_{len(documents)}",  # Unique collection name
-            persist_directory=None  # Use in-memory storage
-        )
-        
-        # Adjust k based on available documents
-        max_k = min(3, len(documents))
-        retriever = vector_store.as_retriever(search_kwargs={"k": max_k})
-        
-        qa_chain = RetrievalQA.from_chain_type(
-            llm=llm,
-            chain_type="stuff",
-            retriever=retriever
-        )
+        async with semaphore:
+            response = await llm_flash.ainvoke(SUMMARIZATION_PROMPT.format(article_description=description, target_language=target_language))
+        return _response_text(response)
+    except Exception as e:
+        print(f"Error summarizing article: {e}")
+        return None
+
+
+async def _asummarize_batch(descriptions: list[str], target_language: str, semaphore: asyncio.Semaphore) -> list[str] | None:
+    """Async variant of _summarize_batch"""
+    try:
+        async with semaphore:
+            response = await llm_flash.ainvoke(_batch_summary_prompt(descriptions, target_language))
+        return _extract_summaries(_response_text(response), len(descriptions))
+    except Exception as e:
+        print(f"Error summarizing articles in one call: {e}")
+        return None
+
+
+async def _afetch_topics(client: httpx.AsyncClient, queries: list[str], semaphore: asyncio.Semaphore) -> list:
+    tasks = [asyncio.create_task(_afetch_topic(client, query, semaphore)) for query in queries]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def aget_personalized_news_stream(
+    profile_summary: str,
+    target_language: str,
+    client: httpx.AsyncClient | None = None,
+    semaphore: asyncio.Semaphore | None = None
+):
+    """Async generator variant of get_personalized_news.
+
+    Searches for every generated query concurrently and summarizes the
+    articles in one batched call (concurrent per-article calls if that fails).
+    Each news item is yielded as soon as its summary is ready. Pass a shared
+    `client` (see create_http_client) to reuse pooled connections, and a
+    shared `semaphore` (see create_provider_limit) to bound provider calls
+    across requests rather than within this one.
+    """
+    if semaphore is None:
+        semaphore = create_provider_limit()
+
+    queries = _search_queries(await _agenerate_queries(profile_summary, semaphore) if _needs_keywords(profile_summary) else [], profile_summary)
+
+    if client is None:
+        async with httpx.AsyncClient(timeout=SERPER_TIMEOUT) as client:
+            results = await _afetch_topics(client, queries, semaphore)
+    else:
+        results = await _afetch_topics(client, queries, semaphore)
+    all_articles = _collect_articles(queries, results)
 
-        prompt = f"""Based on the provided news context, answer the following question.
-        Provide the answer in the language with the ISO 639-1 code: '{target_language}'.
+    if not all_articles:
+        print("No news found after trying all queries.")
+        return
+
+    async def summarize(miss: tuple):
+        return miss, await _asummarize_article(miss[1], target_language, semaphore)
+
+    waves = _SummaryWaves(all_articles, target_language)
+    while wave := waves.next_wave():
+        vectors, summaries = await semantic_cache.alookup(waves.cache_namespace, [description for _, description in wave])
+        hits, misses = waves.split(wave, vectors, summaries)
+        for news_item in hits:
+            yield news_item
+
+        batch = await _asummarize_batch([description for _, description, _ in misses], target_language, semaphore) if waves.batchable(misses) else None
+        if batch is not None:
+            for miss, summary in zip(misses, batch):
+                yield waves.store(miss, summary)
+            continue
+
+        for next_summary in asyncio.as_completed([summarize(miss) for miss in misses]):
+            miss, summary = await next_summary
+            if summary is not None:
+                yield waves.store(miss, summary)
+
+
+async def aget_personalized_news(
+    profile_summary: str,
+    target_language: str,
+    client: httpx.AsyncClient | None = None,
+    semaphore: asyncio.Semaphore | None = None
+) -> list[dict]:
+    """Async variant of get_personalized_news"""
+    return [item async for item in aget_personalized_news_stream(profile_summary, target_language, client, semaphore)]
+
+
+def _feed_documents(news_articles: list[dict]) -> list[Document]:
+    return [
+        Document(
+            page_content=f"Title: {article['title']}\nSummary: {article['summary']}",
+            metadata={"source": article['source'], "link": article['link']}
+        ) for article in news_articles
+    ]
+
+
+class FeedIndex:
+    """Cosine-similarity search over the few documents of one news feed.
+
+    A feed holds at most MAX_ARTICLES documents, so an exact scan of a small
+    normalized matrix replaces a vector database: no collection, tenant or
+    HNSW index to set up, and a search is a single matrix-vector product.
+    """
+
+    def __init__(self, documents: list[Document], vectors):
+        self.documents = documents
+        self.matrix = _normalize_rows(vectors)
+
+    def _top_k(self, query_vector, k: int) -> list[Document]:
+        scores = self.matrix @ _normalize_rows([query_vector])[0]
+        if k < len(scores):
+            # Select the k best without sorting the rest, then order just those
+            top = np.argpartition(-scores, k)[:k]
+            top = top[np.argsort(-scores[top])]
+        else:
+            top = np.argsort(-scores)
+        return [self.documents[i] for i in top]
+
+    def search(self, question: str, k: int) -> list[Document]:
+        return self._top_k(embedding_cache.embed_query(question), k)
+
+    async def asearch(self, question: str, k: int) -> list[Document]:
+        return self._top_k(await embedding_cache.aembed_query(question), k)
+
+
+# Indexes for recently queried feeds, so follow-up questions on the same
+# feed skip re-embedding every article
+FEED_INDEX_CACHE_SIZE = 32
+_feed_indexes: OrderedDict[str, FeedIndex] = OrderedDict()
+_feed_indexes_lock = threading.Lock()
+
+
+def _feed_key(news_articles: list[dict]) -> str:
+    # Summaries are part of the key: the same links in another language are a different feed
+    feed = json.dumps([[article['link'], article['summary']] for article in news_articles])
+    return hashlib.sha1(feed.encode()).hexdigest()
+
+
+def _feed_index(news_articles: list[dict]) -> FeedIndex:
+    key = _feed_key(news_articles)
+    with _feed_indexes_lock:
+        index = _feed_indexes.get(key)
+        if index is not None:
+            _feed_indexes.move_to_end(key)
+            return index
+
+    documents = _feed_documents(news_articles)
+    # Embed the whole feed in one batched request, reusing vectors for articles
+    # already embedded (e.g. for an evicted index of the same feed)
+    index = FeedIndex(documents, embedding_cache.embed_documents([document.page_content for document in documents]))
+
+    with _feed_indexes_lock:
+        _feed_indexes[key] = index
+        _feed_indexes.move_to_end(key)
+        while len(_feed_indexes) > FEED_INDEX_CACHE_SIZE:
+            _feed_indexes.popitem(last=False)
+    return index
+
+
+QA_PROMPT = PromptTemplate(
+    input_variables=["target_language", "context", "question"],
+    template="""Use the following pieces of news context to answer the question at the end.
+        Provide the answer in the language with the ISO 639-1 code given below.
         If the information is not available in the context, say so clearly.
 
+        LANGUAGE: '{target_language}'
+
+        {context}
+
         Question: "{question}"
 
         Answer:
         """
+)
+
+
+def _stuff_prompt(question: str, documents: list[Document], target_language: str) -> str:
+    context = "\n\n".join(document.page_content for document in documents)
+    return QA_PROMPT.format(target_language=target_language, context=context, question=question)
+
+
+def query_news_feed(question: str, news_articles: list[dict], target_language: str) -> str:
+    if not news_articles:
+        return "The news feed hasn't been generated yet. Please generate the news first."
+
+    try:
+        index = _feed_index(news_articles)
+        documents = index.search(question, min(3, len(news_articles)))
+        response = llm.invoke(_stuff_prompt(question, documents, target_language))
+        return _response_text(response) or "I couldn't find relevant information in the news feed."
 
-        # Use invoke instead of run
-        response = qa_chain.invoke({"query": prompt})
-        answer = response.get("result", "I couldn't find relevant information in the news feed.")
-        return answer
-        
     except Exception as e:
         print(f"Error in query_news_feed: {e}")
         # Fallback to simple text matching if vector search fails
         return fallback_text_search(question, news_articles, target_language)
 
 
-def fallback_text_search(question: str, news_articles: list[dict], target_language: str) -> str:
-    """Fallback method for answering questions when vector search fails"""
+async def aquery_news_feed(question: str, news_articles: list[dict], target_language: str) -> str:
+    """Async variant of query_news_feed"""
+    if not news_articles:
+        return "The news feed hasn't been generated yet. Please generate the news first."
+
     try:
-        # Create a context string from all articles
-        context = "\n\n".join([
-            f"Article {i+1}: {article['title']}\nSummary: {article['summary']}"
-            for i, article in enumerate(news_articles)
-        ])
-        
-        prompt = f"""Based on the following news articles, answer the question.
-        Provide the answer in the language with the ISO 639-1 code: '{target_language}'.
+        # Embedding the feed is blocking, so run it in a worker thread
+        index = await asyncio.to_thread(_feed_index, news_articles)
+        documents = await index.asearch(question, min(3, len(news_articles)))
+        response = await llm.ainvoke(_stuff_prompt(question, documents, target_language))
+        return _response_text(response) or "I couldn't find relevant information in the news feed."
+
+    except Exception as e:
+        print(f"Error in query_news_feed: {e}")
+        return await afallback_text_search(question, news_articles, target_language)
+
+
+async def aquery_news_feed_stream(question: str, news_articles: list[dict], target_language: str):
+    """Async generator variant of query_news_feed yielding answer chunks as the LLM produces them"""
+    if not news_articles:
+        yield "The news feed hasn't been generated yet. Please generate the news first."
+        return
+
+    try:
+        index = await asyncio.to_thread(_feed_index, news_articles)
+        documents = await index.asearch(question, min(3, len(news_articles)))
+        prompt = _stuff_prompt(question, documents, target_language)
+
+    except Exception as e:
+        print(f"Error in query_news_feed: {e}")
+        prompt = _fallback_prompt(question, news_articles, target_language)
+
+    async for chunk in llm.astream(prompt):
+        yield _response_text(chunk)
+
+
+FALLBACK_QA_PROMPT = PromptTemplate(
+    input_variables=["target_language", "context", "question"],
+    template="""Based on the following news articles, answer the question.
+        Provide the answer in the language with the ISO 639-1 code given below.
         If the information is not available in the articles, say so clearly.
 
+        LANGUAGE: '{target_language}'
+
         NEWS ARTICLES:
         {context}
 
@@ -306,11 +1002,36 @@ def fallback_text_search(question: str, news_articles: list[dict], target_langua
 
         Answer:
         """
-        
-        response = llm.invoke(prompt)
-        answer = response.content if hasattr(response, 'content') else str(response)
+)
+
+
+def _fallback_prompt(question: str, news_articles: list[dict], target_language: str) -> str:
+    # Create a context string from all articles
+    context = "\n\n".join([
+        f"Article {i+1}: {article['title']}\nSummary: {article['summary']}"
+        for i, article in enumerate(news_articles)
+    ])
+    return FALLBACK_QA_PROMPT.format(target_language=target_language, context=context, question=question)
+
+
+def fallback_text_search(question: str, news_articles: list[dict], target_language: str) -> str:
+    """Fallback method for answering questions when vector search fails"""
+    try:
+        response = llm.invoke(_fallback_prompt(question, news_articles, target_language))
+        answer = _response_text(response)
         return answer.strip()
-        
+
     except Exception as e:
         print(f"Error in fallback text search: {e}")
         return f"I encountered an error while searching for information about your question. Please try rephrasing or check if the news feed loaded correctly."
+
+
+async def afallback_text_search(question: str, news_articles: list[dict], target_language: str) -> str:
+    """Async variant of fallback_text_search"""
+    try:
+        response = await llm.ainvoke(_fallback_prompt(question, news_articles, target_language))
+        return _response_text(response).strip()
+
+    except Exception as e:
+        print(f"Error in fallback text search: {e}")
+        return "I encountered an error while searching for information about your question. Please try rephrasing or check if the news feed loaded correctly."